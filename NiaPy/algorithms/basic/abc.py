@@ -1,5 +1,4 @@
 # encoding=utf8
-import copy
 import logging
 
 from numpy import asarray, full, argmax
@@ -150,7 +149,7 @@ class ArtificialBeeColonyAlgorithm(Algorithm):
 					* Trial (numpy.ndarray): TODO
 		"""
 		for i in range(self.FoodNumber):
-			newSolution = copy.deepcopy(Foods[i])
+			newSolution = SolutionABC(x=Foods[i].x.copy(), e=False)
 			param2change = int(self.rand() * task.D)
 			neighbor = int(self.FoodNumber * self.rand())
 			newSolution.x[param2change] = Foods[i].x[param2change] + (-1 + 2 * self.rand()) * (Foods[i].x[param2change] - Foods[neighbor].x[param2change])
@@ -163,10 +162,10 @@ class ArtificialBeeColonyAlgorithm(Algorithm):
 		while t < self.FoodNumber:
 			if self.rand() < Probs[s]:
 				t += 1
-				Solution = copy.deepcopy(Foods[s])
+				Solution = SolutionABC(x=Foods[s].x.copy(), e=False)
 				param2change = int(self.rand() * task.D)
-				neighbor = int(self.FoodNumber * self.rand())
-				while neighbor == s: neighbor = int(self.FoodNumber * self.rand())
+				neighbor = int((self.FoodNumber - 1) * self.rand())
+				if neighbor >= s: neighbor += 1
 				Solution.x[param2change] = Foods[s].x[param2change] + (-1 + 2 * self.rand()) * (Foods[s].x[param2change] - Foods[neighbor].x[param2change])
 				Solution.evaluate(task, rnd=self.Rand)
 				if Solution.f < Foods[s].f:
@@ -43,7 +43,8 @@ def BroodingSimple(pop, p, task, rnd=rand, **kwargs):
 			1. New population.
 			2. New population function/fitness values.
 	"""
-	for i in range(len(pop)): pop[i] = task.repair(asarray([pop[i, d] if rnd.rand() < p else task.Lower[d] + task.bRange[d] * rnd.rand() for d in range(task.D)]), rnd=rnd)
+	Lower, bRange = task.Lower, task.bRange
+	for i in range(len(pop)): pop[i] = task.repair(asarray([pop[i, d] if rnd.rand() < p else Lower[d] + bRange[d] * rnd.rand() for d in range(task.D)]), rnd=rnd)
 	return pop, apply_along_axis(task.eval, 1, pop)
 
 def MoveCorals(pop, p, F, task, rnd=rand, **kwargs):
@@ -153,8 +153,8 @@ class CuckooSearch(Algorithm):
 		i = self.randint(self.NP)
 		Nn = task.repair(pop[i] + self.alpha * levy.rvs(size=[task.D], random_state=self.Rand), rnd=self.Rand)
 		Nn_f = task.eval(Nn)
-		j = self.randint(self.NP)
-		while i == j: j = self.randint(self.NP)
+		j = self.randint(self.NP - 1)
+		if j >= i: j += 1
 		if Nn_f <= fpop[j]: pop[j], fpop[j] = Nn, Nn_f
 		pop, fpop = self.emptyNests(pop, fpop, pa_v, task)
 		xb, fxb = self.getBest(pop, fpop, xb, fxb)
@@ -1,7 +1,7 @@
 # encoding=utf8
 import logging
 
-from numpy import argsort, sum, exp, apply_along_axis, asarray, where
+from numpy import argsort, sum, exp, apply_along_axis, full, where
 
 from NiaPy.algorithms.algorithm import Algorithm
 
@@ -99,31 +99,34 @@ class FireflyAlgorithm(Algorithm):
 		delta = 1.0 - pow(pow(10.0, -4.0) / 0.9, 1.0 / float(a))
 		return (1 - delta) * alpha
 
-	def move_ffa(self, i, Fireflies, Intensity, oFireflies, alpha, task):
+	def move_ffa(self, Fireflies, Intensity, oFireflies, alpha, task):
 		r"""Move fireflies.
 
+		All fireflies are moved towards brighter firefly `j` at the same time, so that attractiveness of firefly `j` is calculated for whole population at once.
+
 		Args:
-			i (int): Index of current individual.
-			Fireflies (numpy.ndarray):
-			Intensity (numpy.ndarray):
-			oFireflies (numpy.ndarray):
+			Fireflies (numpy.ndarray): Fireflies sorted by intensity.
+			Intensity (numpy.ndarray): Sorted fireflies function/fitness values.
+			oFireflies (numpy.ndarray): Fireflies in original order.
 			alpha (float):
 			task (Task): Optimization task.
 
 		Returns:
-			Tuple[numpy.ndarray, bool]:
-				1. New individual
-				2. ``True`` if individual was moved, ``False`` if individual was not moved
+			Tuple[numpy.ndarray, numpy.ndarray[bool]]:
+				1. Moved fireflies.
+				2. ``True`` for fireflies that were moved, ``False`` for fireflies that were not moved.
 		"""
-		moved = False
+		sFireflies, moved = Fireflies.copy(), full(self.NP, False)
+		betamin, dbeta, gamma, scale = self.betamin, 1.0 - self.betamin, self.gamma, alpha * task.bRange
 		for j in range(self.NP):
-			r = sum((Fireflies[i] - Fireflies[j]) ** 2) ** (1 / 2)
-			if Intensity[i] <= Intensity[j]: continue
-			beta = (1.0 - self.betamin) * exp(-self.gamma * r ** 2.0) + self.betamin
-			tmpf = alpha * (self.uniform(0, 1, task.D) - 0.5) * task.bRange
-			Fireflies[i] = task.repair(Fireflies[i] * (1.0 - beta) + oFireflies[j] * beta + tmpf, rnd=self.Rand)
-			moved = True
-		return Fireflies[i], moved
+			im = where(Intensity > Intensity[j])[0]
+			if len(im) == 0: continue
+			r2 = sum((Fireflies[im] - sFireflies[j]) ** 2, axis=1)
+			beta = (dbeta * exp(-gamma * r2) + betamin)[:, None]
+			tmpf = (self.uniform(0, 1, [len(im), task.D]) - 0.5) * scale
+			Fireflies[im] = apply_along_axis(task.repair, 1, Fireflies[im] * (1.0 - beta) + oFireflies[j] * beta + tmpf, self.Rand)
+			moved[im] = True
+		return Fireflies, moved
 
 	def initPopulation(self, task):
 		r"""Initialize the starting population.
@@ -170,8 +173,7 @@ class FireflyAlgorithm(Algorithm):
 		"""
 		alpha = self.alpha_new(task.nFES / self.NP, alpha)
 		Index = argsort(Intensity)
-		tmp = asarray([self.move_ffa(i, Fireflies[Index], Intensity[Index], Fireflies, alpha, task) for i in range(self.NP)])
-		Fireflies, evalF = asarray([tmp[i][0] for i in range(len(tmp))]), asarray([tmp[i][1] for i in range(len(tmp))])
+		Fireflies, evalF = self.move_ffa(Fireflies[Index], Intensity[Index], Fireflies, alpha, task)
 		Intensity[where(evalF)] = apply_along_axis(task.eval, 1, Fireflies[where(evalF)])
 		xb, fxb = self.getBest(Fireflies, Intensity, xb, fxb)
 		return Fireflies, Intensity, xb, fxb, {'alpha': alpha}
@@ -158,33 +158,37 @@ class ForestOptimizationAlgorithm(Algorithm):
 
 		return seeds.reshape(size, task.D)
 
-	def removeLifeTimeExceeded(self, trees, candidates, age):
+	def removeLifeTimeExceeded(self, trees, candidates, evaluations, age):
 		r"""Remove dead trees.
 
 		Args:
 			 trees (numpy.ndarray): Population to test.
 			 candidates (numpy.ndarray): Candidate population array to be updated.
+			 evaluations (numpy.ndarray[float]): Population fitness values.
 			 age (numpy.ndarray[int32]): Age of trees.
 
 		Returns:
-			 Tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray[int32]]:
+			 Tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray[float], numpy.ndarray[int32]]:
 				  1. Alive trees.
 				  2. New candidate population.
-				  3. Age of trees.
+				  3. Alive trees fitness values.
+				  4. Age of trees.
 		"""
 		lifeTimeExceeded = where(age > self.lt)
 		candidates = trees[lifeTimeExceeded]
 		trees = delete(trees, lifeTimeExceeded, axis=0)
+		evaluations = delete(evaluations, lifeTimeExceeded, axis=0)
 		age = delete(age, lifeTimeExceeded, axis=0)
-		return trees, candidates, age
+		return trees, candidates, evaluations, age
 
-	def survivalOfTheFittest(self, task, trees, candidates, age):
-		r"""Evaluate and filter current population.
+	def survivalOfTheFittest(self, task, trees, candidates, evaluations, age):
+		r"""Filter current population.
 
 		Args:
 			 task (Task): Optimization task.
-			 trees (numpy.ndarray): Population to evaluate.
+			 trees (numpy.ndarray): Population to filter.
 			 candidates (numpy.ndarray): Candidate population array to be updated.
+			 evaluations (numpy.ndarray[float]): Population fitness values.
 			 age (numpy.ndarray[int32]): Age of trees.
 
 		Returns:
@@ -194,7 +198,6 @@ class ForestOptimizationAlgorithm(Algorithm):
 				  3. Population fitness values.
 				  4. Age of trees
 		"""
-		evaluations = apply_along_axis(task.eval, 1, trees)
 		ei = evaluations.argsort()
 		candidates = append(candidates, trees[ei[self.al:]], axis=0)
 		trees = trees[ei[:self.al]]
@@ -246,18 +249,20 @@ class ForestOptimizationAlgorithm(Algorithm):
 		zeroAgeTrees = Trees[age == 0]
 		localSeeds = self.localSeeding(task, zeroAgeTrees)
 		age += 1
-		Trees, candidatePopulation, age = self.removeLifeTimeExceeded(Trees, candidatePopulation, age)
+		Trees, candidatePopulation, Evaluations, age = self.removeLifeTimeExceeded(Trees, candidatePopulation, Evaluations, age)
 		Trees = append(Trees, localSeeds, axis=0)
+		Evaluations = append(Evaluations, apply_along_axis(task.eval, 1, localSeeds))
 		age = append(age, zeros(len(localSeeds), dtype=int32))
-		Trees, candidatePopulation, Evaluations, age = self.survivalOfTheFittest(task, Trees, candidatePopulation, age)
-		gsn = int(self.tr * len(candidatePopulation))
+		Trees, candidatePopulation, Evaluations, age = self.survivalOfTheFittest(task, Trees, candidatePopulation, Evaluations, age)
+		gsn, ib = int(self.tr * len(candidatePopulation)), 0
 		if gsn > 0:
 			globalSeeds = self.globalSeeding(task, candidatePopulation, gsn)
+			gste = apply_along_axis(task.eval, 1, globalSeeds)
+			igs = argmin(gste)
+			if gste[igs] < Evaluations[0]: ib = len(Evaluations) + igs
 			Trees = append(Trees, globalSeeds, axis=0)
 			age = append(age, zeros(len(globalSeeds), dtype=int32))
-			gste = apply_along_axis(task.eval, 1, globalSeeds)
 			Evaluations = append(Evaluations, gste)
-		ib = argmin(Evaluations)
 		age[ib] = 0
 		if Evaluations[ib] < fxb: xb, fxb = Trees[ib].copy(), Evaluations[ib]
 		return Trees, Evaluations, xb, fxb, {'age': age}
@@ -259,6 +259,8 @@ class FireworksAlgorithm(Algorithm):
 	def R(self, x, FW):
 		r"""Calculate ranges.
 
+		Range of individual is the sum of its manhattan distances to all individuals in population, :math:`R(x_i) = \sum_{j} \sum_{d} |x_{i,d} - x_{j,d}|`.
+
 		Args:
 			x (numpy.ndarray): Individual in population.
 			FW (numpy.ndarray): Current population.
@@ -266,7 +268,7 @@ class FireworksAlgorithm(Algorithm):
 		Returns:
 			numpy,ndarray[float]: Ranges values.
 		"""
-		return sqrt(sum(fabs(x - FW)))
+		return sum(fabs(x - FW))
 
 	def p(self, r, Rs):
 		r"""Calculate p.
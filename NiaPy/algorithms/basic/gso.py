@@ -2,7 +2,7 @@
 import logging
 
 from scipy.spatial.distance import euclidean
-from numpy import full, apply_along_axis, copy, sum, fmax, pi, where
+from numpy import full, apply_along_axis, copy, sum, fmax, pi, where, asarray, arange
 
 from NiaPy.algorithms.algorithm import Algorithm
 
@@ -242,10 +242,11 @@ class GlowwormSwarmOptimization(Algorithm):
 		L = self.calcLuciferin(L, GS_f)
 		N = [self.getNeighbors(i, Ro[i], GSo, L) for i in range(self.NP)]
 		P = [self.probabilityes(i, N[i], L) for i in range(self.NP)]
-		j = [self.moveSelect(P[i], i) for i in range(self.NP)]
+		j = asarray([self.moveSelect(P[i], i) for i in range(self.NP)])
 		for i in range(self.NP): GS[i] = task.repair(GSo[i] + self.s * ((GSo[j[i]] - GSo[i]) / (self.Distance(GSo[j[i]], GSo[i]) + 1e-31)), rnd=self.Rand)
 		for i in range(self.NP): R[i] = max(0, min(rs, self.rangeUpdate(Ro[i], N[i], rs)))
-		GS_f = apply_along_axis(task.eval, 1, GS)
+		im = where(j != arange(self.NP))[0]
+		if len(im) > 0: GS_f[im] = apply_along_axis(task.eval, 1, GS[im])
 		xb, fxb = self.getBest(GS, GS_f, xb, fxb)
 		return GS, GS_f, xb, fxb, {'L': L, 'R': R, 'rs': rs}
 
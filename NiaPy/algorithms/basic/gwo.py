@@ -1,7 +1,7 @@
 # encoding=utf8
 import logging
 
-from numpy import fabs, inf
+from numpy import fabs, inf, apply_along_axis, asarray
 
 from NiaPy.algorithms.algorithm import Algorithm
 
@@ -32,6 +32,7 @@ class GreyWolfOptimizer(Algorithm):
 
 	Attributes:
 		Name (List[str]): List of strings representing algorithm names.
+		Map (Callable[[Callable[[numpy.ndarray], float], Iterable[numpy.ndarray]], Iterable[float]]): Function used for mapping fitness/function evaluations over population.
 
 	See Also:
 		* :class:`NiaPy.algorithms.Algorithm`
@@ -43,16 +44,35 @@ class GreyWolfOptimizer(Algorithm):
 			'NP': lambda x: isinstance(x, int) and x > 0
 	}
 
-	def setParameters(self, NP=25, **ukwargs):
+	def setParameters(self, NP=25, Map=map, **ukwargs):
 		r"""Set the algorithm parameters.
 
 		Arguments:
 			NP (int): Number of individuals in population
+			Map (Optional[Callable[[Callable[[numpy.ndarray], float], Iterable[numpy.ndarray]], Iterable[float]]]): Function used for mapping fitness/function evaluations over population.
+
+		Note:
+			`Map` has to call `task.eval` on one individual at a time in the process of the task, as the task checks the stopping condition, counts evaluations and tracks the best solution on every call.
+			Concurrent maps like `map` of `concurrent.futures.ThreadPoolExecutor` overrun the evaluation budget, so `Map` is only useful for wrappers like logging or caching.
 
 		See Also:
 			* :func:`NiaPy.algorithms.Algorithm.setParameters`
 		"""
 		Algorithm.setParameters(self, NP=NP, **ukwargs)
+		self.Map = Map
+
+	def getParameters(self):
+		r"""Get parameters of the algorithm.
+
+		Returns:
+			Dict[str, Any]: Algorithm parameters.
+
+		See Also:
+			* :func:`NiaPy.algorithms.Algorithm.getParameters`
+		"""
+		d = Algorithm.getParameters(self)
+		d.update({'Map': self.Map})
+		return d
 
 	def initPopulation(self, task):
 		r"""Initialize population.
@@ -104,15 +124,11 @@ class GreyWolfOptimizer(Algorithm):
 					* A (): TODO
 		"""
 		a = 2 - task.Evals * (2 / task.nFES)
-		for i, w in enumerate(pop):
-			A1, C1 = 2 * a * self.rand(task.D) - a, 2 * self.rand(task.D)
-			X1 = A - A1 * fabs(C1 * A - w)
-			A2, C2 = 2 * a * self.rand(task.D) - a, 2 * self.rand(task.D)
-			X2 = B - A2 * fabs(C2 * B - w)
-			A3, C3 = 2 * a * self.rand(task.D) - a, 2 * self.rand(task.D)
-			X3 = D - A3 * fabs(C3 * D - w)
-			pop[i] = task.repair((X1 + X2 + X3) / 3, self.Rand)
-			fpop[i] = task.eval(pop[i])
+		r = self.rand([self.NP, 6, task.D])
+		A1, C1, A2, C2, A3, C3 = 2 * a * r[:, 0] - a, 2 * r[:, 1], 2 * a * r[:, 2] - a, 2 * r[:, 3], 2 * a * r[:, 4] - a, 2 * r[:, 5]
+		X1, X2, X3 = A - A1 * fabs(C1 * A - pop), B - A2 * fabs(C2 * B - pop), D - A3 * fabs(C3 * D - pop)
+		pop = apply_along_axis(task.repair, 1, (X1 + X2 + X3) / 3, self.Rand)
+		fpop = asarray(list(self.Map(task.eval, pop)))
 		for i, f in enumerate(fpop):
 			if f < A_f: A, A_f = pop[i].copy(), f
 			elif A_f < f < B_f: B, B_f = pop[i].copy(), f
@@ -1,7 +1,7 @@
 # encoding=utf8
 import logging
 from scipy.spatial.distance import euclidean as ed
-from numpy import apply_along_axis, argmin, argmax, sum, full, inf, asarray, mean, where, sqrt
+from numpy import apply_along_axis, argmin, argmax, sum, full, inf, asarray, mean, where, sqrt, einsum, ascontiguousarray, float64
 from NiaPy.util import fullArray
 from NiaPy.algorithms.algorithm import Algorithm
 
@@ -46,6 +46,7 @@ class KrillHerd(Algorithm):
 		Cr (float): Crossover probability.
 		Mu (float): Mutation probability.
 		epsilon (float): Small numbers for division.
+		dtype (numpy.dtype): Floating point type used for calculating distances between krills.
 
 	See Also:
 		* :class:`NiaPy.algorithms.algorithm.Algorithm`
@@ -89,7 +90,7 @@ class KrillHerd(Algorithm):
 		})
 		return d
 
-	def setParameters(self, NP=50, N_max=0.01, V_f=0.02, D_max=0.002, C_t=0.93, W_n=0.42, W_f=0.38, d_s=2.63, nn=5, Cr=0.2, Mu=0.05, epsilon=1e-31, **ukwargs):
+	def setParameters(self, NP=50, N_max=0.01, V_f=0.02, D_max=0.002, C_t=0.93, W_n=0.42, W_f=0.38, d_s=2.63, nn=5, Cr=0.2, Mu=0.05, epsilon=1e-31, dtype=float64, **ukwargs):
 		r"""Set the arguments of an algorithm.
 
 		Arguments:
@@ -105,12 +106,16 @@ class KrillHerd(Algorithm):
 			Cr (Optional[float]): Crossover probability.
 			Mu (Optional[float]): Mutation probability.
 			epsilon (Optional[float]): Small numbers for division.
+			dtype (Optional[numpy.dtype]): Floating point type used for calculating distances between krills.
+
+		Note:
+			Using ``numpy.float32`` halves the memory traffic of the `{D, NP, NP}` difference array on large herds at the cost of precision.
 
 		See Also:
 			* :func:`NiaPy.algorithms.algorithm.Algorithm.setParameters`
 		"""
 		Algorithm.setParameters(self, NP=NP, **ukwargs)
-		self.N_max, self.V_f, self.D_max, self.C_t, self.W_n, self.W_f, self.d_s, self.nn, self._Cr, self._Mu, self.epsilon = N_max, V_f, D_max, C_t, W_n, W_f, d_s, nn, Cr, Mu, epsilon
+		self.N_max, self.V_f, self.D_max, self.C_t, self.W_n, self.W_f, self.d_s, self.nn, self._Cr, self._Mu, self.epsilon, self.dtype = N_max, V_f, D_max, C_t, W_n, W_f, d_s, nn, Cr, Mu, epsilon, dtype
 
 	def getParameters(self):
 		r"""Get parameter values for the algorithm.
@@ -130,7 +135,8 @@ class KrillHerd(Algorithm):
 			'nn': self.nn,
 			'Cr': self.Cr,
 			'Mu': self.Mu,
-			'epsilon': self.epsilon
+			'epsilon': self.epsilon,
+			'dtype': self.dtype
 		})
 		return d
 
@@ -147,34 +153,45 @@ class KrillHerd(Algorithm):
 		"""
 		return fullArray(self.W_n, task.D), fullArray(self.W_f, task.D)
 
-	def sensRange(self, ki, KH):
+	def getDistances(self, KH):
+		r"""Get euclidean distances between all pairs of krills in herd.
+
+		Args:
+			KH (numpy.ndarray): Krill heard population.
+
+		Returns:
+			numpy.ndarray: Matrix of distances with shape `{NP, NP}`.
+		"""
+		KHt = ascontiguousarray(KH.T, dtype=self.dtype)
+		diff = KHt[:, :, None] - KHt[:, None, :]
+		return sqrt(einsum('kij,kij->ij', diff, diff))
+
+	def sensRange(self, ki, KH_d):
 		r"""Calculate sense range for selected individual.
 
 		Args:
 			ki (int): Selected individual.
-			KH (numpy.ndarray): Krill heard population.
+			KH_d (numpy.ndarray): Distances between krills in herd.
 
 		Returns:
 			float: Sense range for krill.
 		"""
-		return sum([ed(KH[ki], KH[i]) for i in range(self.NP)]) / (self.nn * self.NP)
+		return sum(KH_d[ki]) / (self.nn * self.NP)
 
-	def getNeighbours(self, i, ids, KH):
+	def getNeighbours(self, i, ids, KH_d):
 		r"""Get neighbours.
 
 		Args:
 			i (int): Individual looking for neighbours.
 			ids (float): Maximal distance for being a neighbour.
-			KH (numpy.ndarray): Current population.
+			KH_d (numpy.ndarray): Distances between krills in herd.
 
 		Returns:
 			numpy.ndarray: Neighbours of krill heard.
 		"""
-		N = list()
-		for j in range(self.NP):
-			if j != i and ids > ed(KH[i], KH[j]): N.append(j)
-		if not N: N.append(self.randint(self.NP))
-		return asarray(N)
+		N = where(ids > KH_d[i])[0]
+		N = N[N != i]
+		return N if len(N) > 0 else asarray([self.randint(self.NP)])
 
 	def funX(self, x, y):
 		r"""Get x values.
@@ -202,7 +219,7 @@ class KrillHerd(Algorithm):
 		"""
 		return ((x - y) + self.epsilon) / ((w - b) + self.epsilon)
 
-	def induceNeighborsMotion(self, i, n, W, KH, KH_f, ikh_b, ikh_w, task):
+	def induceNeighborsMotion(self, i, n, W, KH, KH_f, KH_d, ikh_b, ikh_w, task):
 		r"""Induced neighbours motion operator.
 
 		Args:
@@ -211,6 +228,7 @@ class KrillHerd(Algorithm):
 			W (numpy.ndarray[float]): Wights for this operator.
 			KH (numpy.ndarray): Current heard/population.
 			KH_f (numpy.ndarray[float]): Current populations/heard function/fitness values.
+			KH_d (numpy.ndarray): Distances between krills in heard/population.
 			ikh_b (int): Current best krill in heard/population.
 			ikh_w (int): Current worst krill in heard/population.
 			task (Task): Optimization task.
@@ -218,9 +236,10 @@ class KrillHerd(Algorithm):
 		Returns:
 			numpy.ndarray: Moved krill.
 		"""
-		Ni = self.getNeighbours(i, self.sensRange(i, KH), KH)
+		Ni = self.getNeighbours(i, self.sensRange(i, KH_d), KH_d)
 		Nx, Nf, f_b, f_w = KH[Ni], KH_f[Ni], KH_f[ikh_b], KH_f[ikh_w]
-		alpha_l = sum(asarray([self.funK(KH_f[i], j, f_b, f_w) for j in Nf]) * asarray([self.funX(KH[i], j) for j in Nx]).T)
+		Xn = ((Nx - KH[i]) + self.epsilon) / (KH_d[i, Ni][:, None] + self.epsilon)
+		alpha_l = sum(self.funK(KH_f[i], Nf, f_b, f_w)[:, None] * Xn)
 		alpha_t = 2 * (1 + self.rand() * task.Iters / task.nGEN)
 		return self.N_max * (alpha_l + alpha_t) + W * n
 
@@ -279,7 +298,7 @@ class KrillHerd(Algorithm):
 		Returns:
 			numpy.ndarray: Crossoverd krill/individual.
 		"""
-		return [xo[i] if self.rand() < Cr else x[i] for i in range(len(x))]
+		return where(self.rand(len(x)) < Cr, xo, x)
 
 	def mutate(self, x, x_b, Mu):
 		r"""Mutate operator.
@@ -292,7 +311,8 @@ class KrillHerd(Algorithm):
 		Returns:
 			numpy.ndarray: Mutated krill.
 		"""
-		return [x[i] if self.rand() < Mu else (x_b[i] + self.rand()) for i in range(len(x))]
+		r = self.rand([2, len(x)])
+		return where(r[0] < Mu, x, x_b + r[1])
 
 	def getFoodLocation(self, KH, KH_f, task):
 		r"""Get food location for krill heard.
@@ -394,7 +414,8 @@ class KrillHerd(Algorithm):
 		ikh_b, ikh_w = argmin(KH_f), argmax(KH_f)
 		x_food, x_food_f = self.getFoodLocation(KH, KH_f, task)
 		if x_food_f < fxb: xb, fxb = x_food, x_food_f  # noqa: F841
-		N = asarray([self.induceNeighborsMotion(i, N[i], W_n, KH, KH_f, ikh_b, ikh_w, task) for i in range(self.NP)])
+		KH_d = self.getDistances(KH)
+		N = asarray([self.induceNeighborsMotion(i, N[i], W_n, KH, KH_f, KH_d, ikh_b, ikh_w, task) for i in range(self.NP)])
 		F = asarray([self.induceForagingMotion(i, x_food, x_food_f, F[i], W_f, KH, KH_f, ikh_b, ikh_w, task) for i in range(self.NP)])
 		D = asarray([self.inducePhysicalDiffusion(task) for i in range(self.NP)])
 		KH_n = KH + (self.deltaT(task) * (N + F + D))
@@ -222,7 +222,7 @@ class ParticleSwarmAlgorithm(Algorithm):
 			pop[i] = task.repair(pop[i] + V[i], rnd=self.Rand)
 			fpop[i] = task.eval(pop[i])
 			if fpop[i] < fpopb[i]:
-				popb[i], fpopb[i] = pop[i].copy(), fpop[i]
+				popb[i], fpopb[i] = pop[i], fpop[i]
 				if fpop[i] < fxb: xb, fxb = pop[i].copy(), fpop[i]
 		return pop, fpop, xb, fxb, {'popb': popb, 'fpopb': fpopb, 'w': w, 'vMin': vMin, 'vMax': vMax, 'V': V}
 
@@ -477,7 +477,7 @@ class OppositionVelocityClampingParticleSwarmOptimization(ParticleSwarmAlgorithm
 				pop[i] = task.repair(pop[i] + V[i], rnd=self.Rand)
 				fpop[i] = task.eval(pop[i])
 				if fpop[i] < fpopb[i]:
-					popb[i], fpopb[i] = pop[i].copy(), fpop[i]
+					popb[i], fpopb[i] = pop[i], fpop[i]
 					if fpop[i] < fxb: xb, fxb = pop[i].copy(), fpop[i]
 			vMin, vMax = self.sigma * np.min(pop, axis=0), self.sigma * np.max(pop, axis=0)
 		return pop, fpop, xb, fxb, {'popb': popb, 'fpopb': fpopb, 'vMin': vMin, 'vMax': vMax, 'V': V, 'S_l': S_l, 'S_h': S_h}
@@ -1007,7 +1007,7 @@ class ComprehensiveLearningParticleSwarmOptimizer(ParticleSwarmAlgorithm):
 				pop[i] = task.repair(pop[i] + V[i], rnd=self.Rand)
 				fpop[i] = task.eval(pop[i])
 				if fpop[i] < fpopb[i]:
-					popb[i], fpopb[i] = pop[i].copy(), fpop[i]
+					popb[i], fpopb[i] = pop[i], fpop[i]
 					if fpop[i] < fxb: xb, fxb = pop[i].copy(), fpop[i]
 				flag[i] = 0
 			pbest = self.generatePbestCL(i, Pc[i], popb, fpopb)
@@ -1016,7 +1016,7 @@ class ComprehensiveLearningParticleSwarmOptimizer(ParticleSwarmAlgorithm):
 			if not ((pop[i] < task.Lower).any() or (pop[i] > task.Upper).any()):
 				fpop[i] = task.eval(pop[i])
 				if fpop[i] < fpopb[i]:
-					popb[i], fpopb[i] = pop[i].copy(), fpop[i]
+					popb[i], fpopb[i] = pop[i], fpop[i]
 					if fpop[i] < fxb: xb, fxb = pop[i].copy(), fpop[i]
 		return pop, fpop, xb, fxb, {'popb': popb, 'fpopb': fpopb, 'vMin': vMin, 'vMax': vMax, 'V': V, 'flag': flag, 'Pc': Pc}
 
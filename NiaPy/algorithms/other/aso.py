@@ -1,6 +1,6 @@
 # encoding=utf8
 import logging
-from scipy.spatial.distance import euclidean
+from scipy.spatial.distance import euclidean, cdist
 from numpy import apply_along_axis, argmin, full, inf, where, asarray, random as rand, sort, exp
 from NiaPy.algorithms.algorithm import Algorithm
 from NiaPy.util import fullArray
@@ -289,23 +289,23 @@ class AnarchicSocietyOptimization(Algorithm):
 		"""
 		return 1 - exp(-theta * self.d(x_f, xpb_f))
 
-	def getBestNeighbors(self, i, X, X_f, rs):
-		r"""Get neighbors of individual.
+	def getBestNeighbors(self, X, X_f, rs):
+		r"""Get best neighbors of all individuals.
 
 		Mesurment of distance for neighborhud is defined with `self.nl`.
 		Function for calculating distances is define with `self.dn`.
+		Best neighbors are found with one masked reduction over the whole distance matrix.
 
 		Args:
-			i (int): Index of individual for hum we are looking for neighbours.
 			X (numpy.ndarray): Current population.
 			X_f (numpy.ndarray[float]): Current population fitness/function values.
 			rs (numpy.ndarray[float]): Distance between individuals.
 
 		Returns:
-			numpy.ndarray[int]: Indexes that represent individuals closest to `i`-th individual.
+			numpy.ndarray[int]: Indexes of best individuals in neighborhood of each individual.
 		"""
-		nn = asarray([self.dn(X[i], X[j]) / rs for j in range(len(X))])
-		return argmin(X_f[where(nn <= self.nl)])
+		mask = cdist(X, X, self.dn) / rs <= self.nl
+		return argmin(where(mask, X_f[None, :], inf), axis=1)
 
 	def uBestAndPBest(self, X, X_f, Xpb, Xpb_f):
 		r"""Update personal best solution of all individuals in population.
@@ -385,7 +385,7 @@ class AnarchicSocietyOptimization(Algorithm):
 					* theta (numpy.ndarray):
 					* rs (float): Distance of search space.
 		"""
-		Xin = [self.getBestNeighbors(i, X, X_f, rs) for i in range(len(X))]
+		Xin = self.getBestNeighbors(X, X_f, rs)
 		MP_c, MP_s, MP_p = asarray([self.FI(X_f[i], Xpb_f[i], fxb, alpha[i]) for i in range(len(X))]), asarray([self.EI(X_f[i], X_f[Xin[i]], gamma[i]) for i in range(len(X))]), asarray([self.II(X_f[i], Xpb_f[i], theta[i]) for i in range(len(X))])
 		Xtmp = asarray([self.Combination(X[i], Xpb[i], xb, X[self.randint(len(X), skip=[i])], MP_c[i], MP_s[i], MP_p[i], self.F, self.CR, task, self.Rand) for i in range(len(X))])
 		X, X_f = asarray([Xtmp[i][0] for i in range(len(X))]), asarray([Xtmp[i][1] for i in range(len(X))])
@@ -1,4 +1,7 @@
 # encoding=utf8
+from numpy import argmin
+from scipy.spatial.distance import euclidean
+
 from NiaPy.tests.test_algorithm import AlgorithmTestCase, MyBenchmark
 
 from NiaPy.algorithms.other import AnarchicSocietyOptimization
@@ -24,6 +27,14 @@ class ASOTestCase(AlgorithmTestCase):
 		self.assertTrue(d['gamma'](10))
 		self.assertTrue(d['theta'](10))
 
+	def test_best_neighbors_fine(self):
+		aso = self.algo(NP=10, nl=0.5, seed=self.seed)
+		X, X_f = aso.uniform(0, 1, [10, 3]), aso.uniform(0, 1, 10)
+		Xin = aso.getBestNeighbors(X, X_f, 1)
+		for i in range(len(X)):
+			nn = [j for j in range(len(X)) if euclidean(X[i], X[j]) <= 0.5]
+			self.assertEqual(Xin[i], nn[argmin(X_f[nn])])
+
 class ASOElitismTestCase(ASOTestCase):
 	def test_custom_works_fine(self):
 		aso_custom = self.algo(NP=40, Combination=Elitism, seed=self.seed)
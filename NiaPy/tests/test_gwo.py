@@ -17,3 +17,14 @@ class GWOTestCase(AlgorithmTestCase):
 		gwo_griewank = self.algo(NP=10, seed=self.seed)
 		gwo_griewankc = self.algo(NP=10, seed=self.seed)
 		AlgorithmTestCase.test_algorithm_run(self, gwo_griewank, gwo_griewankc)
+
+	def test_custom_map_works_fine(self):
+		sizes = []
+		def counting_map(f, X):
+			sizes.append(len(X))
+			return map(f, X)
+		gwo_map, (task, _) = self.algo(NP=20, Map=counting_map, seed=self.seed), self.setUpTasks(10, MyBenchmark(), nFES=10000, nGEN=15)
+		gwo_map.run(task)
+		self.assertFalse(gwo_map.bad_run(), gwo_map.exception)
+		self.assertEqual(len(sizes), task.Iters - 1)
+		self.assertTrue(all(s == 20 for s in sizes))
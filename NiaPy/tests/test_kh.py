@@ -1,4 +1,7 @@
 # encoding=utf8
+from scipy.spatial.distance import euclidean
+from numpy import random as rnd, float32
+
 from NiaPy.tests.test_algorithm import AlgorithmTestCase, MyBenchmark
 from NiaPy.algorithms.basic import KrillHerdV1, KrillHerdV2, KrillHerdV3, KrillHerdV4, KrillHerdV11
 
@@ -18,6 +21,25 @@ class KHV1TestCase(AlgorithmTestCase):
 		AlgorithmTestCase.setUp(self)
 		self.algo = KrillHerdV1
 
+	def test_distances_fine(self):
+		kh, KH = self.algo(NP=10, seed=self.seed), rnd.RandomState(self.seed).uniform(-10, 10, (10, 5))
+		KH_d = kh.getDistances(KH)
+		self.assertEqual(KH_d.shape, (10, 10))
+		for i in range(10):
+			for j in range(10): self.assertAlmostEqual(KH_d[i, j], euclidean(KH[i], KH[j]))
+
+	def test_distances_float32_fine(self):
+		kh, KH = self.algo(NP=10, dtype=float32, seed=self.seed), rnd.RandomState(self.seed).uniform(-10, 10, (10, 5))
+		KH_d = kh.getDistances(KH)
+		self.assertEqual(KH_d.dtype, float32)
+		for i in range(10):
+			for j in range(10): self.assertAlmostEqual(KH_d[i, j], euclidean(KH[i], KH[j]), places=4)
+
+	def test_custom_float32_works_fine(self):
+		kh_custom = self.algo(NP=10, dtype=float32, seed=self.seed)
+		kh_customc = self.algo(NP=10, dtype=float32, seed=self.seed)
+		AlgorithmTestCase.test_algorithm_run(self, kh_custom, kh_customc, MyBenchmark())
+
 	def test_type_parametes(self):
 		d = self.algo.typeParameters()
 		self.assertIsNotNone(d.get('N_max', None))